@@ -1,17 +1,25 @@
 import streamlit as st
-import pytube
 from googleapiclient.discovery import build
-import pandas as pd
+from googleapiclient.model import JsonModel
+import httplib2
 import re
-from datetime import datetime, timedelta
-import json
-from collections import defaultdict
+from datetime import timedelta
 import logging
-import traceback
-import ssl
-import certifi
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
+import time
+import pickle
+import hashlib
+import functools
+import heapq
+from html import escape
+from pathlib import Path
 from dotenv import load_dotenv
+try:
+    import orjson  # 응답 JSON 파싱 가속 (없으면 표준 json 사용)
+except ImportError:
+    orjson = None
 
 # 환경 변수 로드
 load_dotenv()
@@ -22,25 +30,166 @@ logger = logging.getLogger(__name__)
 
 # YouTube API 키 설정
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")  # 환경 변수에서 API 키 가져오기
-youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+
+class OrjsonModel(JsonModel):
+    """YouTube API 응답을 orjson으로 파싱하는 모델"""
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+# 디스크 캐시 경로 (앱 재시작 후에도 API 응답 재사용)
+_DISK_CACHE_DIR = Path.home() / '.cache' / 'das'
+
+@st.cache_resource(show_spinner=False)
+def get_api_executor():
+    """YouTube API 호출용 스레드 풀 (재실행/세션 간 공유되어 스레드별 클라이언트와 연결이 유지됨)"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='youtube-api')
+
+@st.cache_resource(show_spinner=False)
+def _youtube_clients():
+    """스레드별 YouTube API 클라이언트 저장소 (재실행 간 유지)"""
+    return threading.local()
+
+def get_youtube():
+    """현재 스레드 전용 YouTube API 클라이언트 반환 (httplib2는 스레드 안전하지 않음)"""
+    clients = _youtube_clients()
+    client = getattr(clients, 'youtube', None)
+    if client is None:
+        # 같은 Http 객체를 재사용해 HTTPS 연결을 유지
+        # (httplib2 디스크 캐시는 API 키가 들어간 요청 URL을 평문으로 저장하므로 사용하지 않음)
+        http = httplib2.Http()
+        client = clients.youtube = build(
+            'youtube', 'v3',
+            developerKey=YOUTUBE_API_KEY,
+            http=http,
+            model=OrjsonModel() if orjson else None
+        )
+    return client
+
+def _prune_disk_cache(name, ttl):
+    """ttl(초)보다 오래된 저장본 삭제 (영상마다 파일이 생기므로 캐시 폴더가 계속 커지지 않도록)"""
+    cutoff = time.time() - ttl
+    for path in _DISK_CACHE_DIR.glob(f"{name}-*.pkl"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            pass  # 다른 스레드가 먼저 삭제
+        except Exception as e:
+            logger.warning(f"디스크 캐시 정리 실패: {str(e)}")
+
+def disk_cache(ttl, fallback):
+    """API 응답을 디스크에 저장하는 데코레이터
+
+    - ttl(초) 이내의 저장본이 있으면 API를 호출하지 않고 바로 반환
+    - API 호출이 실패하면 오래된 저장본이라도 반환, 저장본이 없으면 fallback() 반환
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = hashlib.sha1(repr(args).encode()).hexdigest()[:16]
+            path = _DISK_CACHE_DIR / f"{func.__name__}-{key}.pkl"
+            
+            cached = None
+            try:
+                with open(path, 'rb') as f:
+                    cached = pickle.load(f)  # (저장 시각, 결과)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"디스크 캐시 읽기 실패: {str(e)}")
+            
+            if cached and time.time() - cached[0] < ttl:
+                return cached[1]
+            
+            try:
+                result = func(*args)
+            except Exception:
+                if cached:
+                    age_minutes = int((time.time() - cached[0]) // 60)
+                    logger.warning(f"{func.__name__}: API 실패, {age_minutes}분 전 캐시 사용")
+                    return cached[1]
+                return fallback()
+            
+            try:
+                _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((time.time(), result), f)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"디스크 캐시 저장 실패: {str(e)}")
+            
+            _prune_disk_cache(func.__name__, ttl)
+            return result
+        return wrapper
+    return decorator
+
+# 정규식 패턴 (모듈 로드 시 한 번만 컴파일)
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_TS_RE = re.compile(r'(?:(\d{1,2}):)?(\d{1,2}):(\d{2})')
+_VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|embed/)([A-Za-z0-9_-]{11})')
+_BARE_VIDEO_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+
+def inject_css(css):
+    """페이지 스타일(모듈 상수) 출력"""
+    st.markdown(css, unsafe_allow_html=True)
+
+def _extract_video_id(url):
+    """YouTube URL에서 video_id 추출 (watch?v=, youtu.be/, embed/ 형식 지원)"""
+    # 가장 흔한 watch?v= 형식은 정규식 없이 바로 잘라냄
+    pos = url.find('watch?v=')
+    if pos != -1:
+        video_id = url[pos + 8:pos + 19]
+        # 잘라낸 11글자가 올바른 ID일 때만 사용 (아니면 정규식으로 처리)
+        if _BARE_VIDEO_ID_RE.fullmatch(video_id):
+            return video_id
+    
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else ''
 
 def parse_duration(duration):
     """YouTube API의 duration 문자열을 초 단위로 변환"""
-    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
+    match = _DURATION_RE.match(duration)
     if not match:
         return 0
     
-    hours = int(match.group(1) or 0)
-    minutes = int(match.group(2) or 0)
-    seconds = int(match.group(3) or 0)
+    hours, minutes, seconds = match.groups(0)
+    
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+def _fetch_video_details(video_ids):
+    """videos.list 한 번으로 여러 영상의 상세 정보 가져오기 (최대 50개, video_id -> item)"""
+    response = get_youtube().videos().list(
+        part="snippet,statistics,contentDetails",
+        id=','.join(video_ids[:50]),
+        fields="items(id,snippet(title,thumbnails/high/url),statistics(viewCount,commentCount),contentDetails/duration)"
+    ).execute()
     
-    return hours * 3600 + minutes * 60 + seconds
+    return {item['id']: item for item in response.get('items', [])}
+
+def _video_data(item):
+    """videos.list 응답 item을 비디오 카드용 딕셔너리로 변환"""
+    return {
+        'id': item['id'],
+        'title': item['snippet']['title'],
+        'thumbnail': item['snippet']['thumbnails']['high']['url'],
+        'url': f"https://www.youtube.com/watch?v={item['id']}",
+        'viewCount': int(item['statistics'].get('viewCount', 0)),
+        'commentCount': int(item['statistics'].get('commentCount', 0))
+    }
 
 @st.cache_data(ttl=86400)  # 24시간 캐시
+@disk_cache(ttl=86400, fallback=list)
 def get_trending_videos():
     """인기 급상승 동영상 가져오기"""
     try:
-        request = youtube.videos().list(
+        request = get_youtube().videos().list(
             part="snippet,statistics",
             chart="mostPopular",
             regionCode="KR",
@@ -52,29 +201,19 @@ def get_trending_videos():
         trending_videos = []
         
         for item in response['items']:
-            video_data = {
-                'id': item['id'],
-                'title': item['snippet']['title'],
-                'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                'url': f"https://www.youtube.com/watch?v={item['id']}",
-                'viewCount': int(item['statistics']['viewCount']),
-                'commentCount': int(item['statistics'].get('commentCount', 0))
-            }
-            trending_videos.append(video_data)
+            trending_videos.append(_video_data(item))
         
         return trending_videos
         
     except Exception as e:
         logger.error(f"인기 동영상 가져오기 실패: {str(e)}")
-        return []
+        raise
 
 @st.cache_data(ttl=86400)  # 24시간 캐시
-def get_video_info(url):
-    """YouTube 영상 정보를 가져오는 함수"""
+def get_video_info_by_id(video_id):
+    """YouTube 영상 정보를 가져오는 함수 (캐시 키는 video_id)"""
     try:
-        video_id = url.split('watch?v=')[1].split('&')[0]
-        
-        video_response = youtube.videos().list(
+        video_response = get_youtube().videos().list(
             part='snippet,statistics',
             id=video_id,
             fields='items(snippet(title,channelTitle),statistics(viewCount,likeCount,commentCount))'
@@ -87,55 +226,52 @@ def get_video_info(url):
         return None
 
 @st.cache_data(ttl=3600)  # 1시간 캐시
+@disk_cache(ttl=3600, fallback=list)
 def get_woosoo_videos():
     """웃소 채널의 최근 동영상 가져오기 (숏폼 제외)"""
     try:
         channel_id = "UCmzMtXrJgfCqA0rfhz8_P4A"
         
-        request = youtube.search().list(
-            part="snippet",
+        request = get_youtube().search().list(
+            part="id",
             channelId=channel_id,
             order="date",
             maxResults=15,
-            type="video"
+            type="video",
+            fields="items/id/videoId"
         )
         response = request.execute()
         
         video_ids = [item['id']['videoId'] for item in response['items']]
         
-        videos_request = youtube.videos().list(
-            part="snippet,statistics,contentDetails",
-            id=','.join(video_ids)
-        )
-        videos_response = videos_request.execute()
+        video_details = _fetch_video_details(video_ids)
         
         woosoo_videos = []
-        for item in videos_response['items']:
+        for video_id in video_ids:
+            item = video_details.get(video_id)
+            if item is None:
+                continue
+            
             duration = item['contentDetails']['duration']
             duration_seconds = parse_duration(duration)
             
             if duration_seconds > 61:
-                video_data = {
-                    'id': item['id'],
-                    'title': item['snippet']['title'],
-                    'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                    'url': f"https://www.youtube.com/watch?v={item['id']}",
-                    'viewCount': int(item['statistics'].get('viewCount', 0)),
-                    'commentCount': int(item['statistics'].get('commentCount', 0))
-                }
-                woosoo_videos.append(video_data)
-        
-        return woosoo_videos[:4]
+                woosoo_videos.append(_video_data(item))
+                if len(woosoo_videos) == 4:
+                    break
+        
+        return woosoo_videos
             
     except Exception as e:
         logger.error(f"웃소 채널 동영상 가져오기 실패: {str(e)}")
-        return []
+        raise
 
 @st.cache_data(ttl=3600)  # 1시간 캐시
+@disk_cache(ttl=3600, fallback=list)
 def get_comments(video_id):
     """YouTube 비디오의 댓글을 가져오는 함수"""
     try:
-        request = youtube.commentThreads().list(
+        request = get_youtube().commentThreads().list(
             part="snippet",
             videoId=video_id,
             maxResults=30,
@@ -145,83 +281,83 @@ def get_comments(video_id):
         )
         
         comments_list = []
-        try:
-            response = request.execute()
-            for item in response['items']:
-                comment = item['snippet']['topLevelComment']['snippet']
-                comments_list.append({
-                    'text': comment['textDisplay'],
-                    'authorDisplayName': comment['authorDisplayName'],
-                    'likeCount': comment.get('likeCount', 0),
-                    'publishedAt': comment['publishedAt']
-                })
-        except Exception as api_error:
-            logger.warning(f"API를 통한 댓글 가져오기 실패: {str(api_error)}")
-        
-        return pd.DataFrame(comments_list)
+        response = request.execute()
+        for item in response['items']:
+            comment = item['snippet']['topLevelComment']['snippet']
+            comments_list.append({
+                'text': comment['textDisplay'],
+                'authorDisplayName': comment['authorDisplayName'],
+                'likeCount': comment.get('likeCount', 0),
+                'publishedAt': comment['publishedAt']
+            })
+        
+        return comments_list
         
     except Exception as e:
         logger.error(f"댓글 가져오기 실패: {str(e)}")
-        return pd.DataFrame()
+        raise
 
 def parse_timestamp(text):
     """댓글에서 타임스탬프를 추출하는 함수"""
     try:
         # HH:MM:SS 또는 MM:SS 형식의 타임스탬프 찾기
-        timestamp_pattern = r'(\d{1,2}:)?\d{1,2}:\d{2}'
-        match = re.search(timestamp_pattern, text)
+        match = _TS_RE.search(text)
         
         if match:
-            timestamp = match.group(0)
-            # 시간을 초로 변환
-            time_parts = timestamp.split(':')
-            if len(time_parts) == 2:
-                minutes, seconds = map(int, time_parts)
-                total_seconds = minutes * 60 + seconds
-            else:
-                hours, minutes, seconds = map(int, time_parts)
-                total_seconds = hours * 3600 + minutes * 60 + seconds
-            return total_seconds
+            # 캡처된 시/분/초를 바로 초로 변환
+            hours, minutes, seconds = match.groups(0)
+            return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
         return None
     except Exception as e:
         logger.error(f"타임스탬프 파싱 실패: {str(e)}")
     return None
 
+@functools.lru_cache(maxsize=2048)
+def _format_seconds(seconds):
+    """정수 초를 HH:MM:SS 문자열로 변환 (성공한 결과만 캐시)"""
+    return str(timedelta(seconds=seconds))
+
 def seconds_to_timestamp(seconds):
     """초를 타임스탬프 형식(HH:MM:SS)으로 변환하는 함수"""
     try:
-        return str(timedelta(seconds=int(seconds)))
+        return _format_seconds(int(seconds))
     except Exception as e:
         logger.error(f"초 변환 실패: {str(e)}")
         return "00:00:00"
 
-def aggregate_timeline_comments(df):
-    """타임스탬프별 댓글을 집계하는 함수"""
-    # 비슷한 시간대(5초 이내)의 댓글을 그룹화
-    timeline_data = defaultdict(lambda: {'comments': [], 'total_likes': 0, 'representative_time': 0})
-    
-    # 타임스탬프가 있는 댓글만 필터링
-    timestamp_comments = df[df['timestamp'].notna()].copy()
+def aggregate_timeline_comments(comments):
+    """타임스탬프별 댓글을 집계하는 함수 (집계 결과, 좋아요가 가장 많은 그룹의 시간) 반환"""
+    # 타임스탬프가 있는 댓글만 필터링 후 타임스탬프로 정렬
+    timestamp_comments = sorted(
+        (comment for comment in comments if comment['timestamp'] is not None),
+        key=lambda comment: comment['timestamp']
+    )
     
-    if len(timestamp_comments) == 0:
-        return {}
-    
-    # 타임스탬프로 정렬
-    timestamp_comments = timestamp_comments.sort_values('timestamp')
+    # 비슷한 시간대(5초 이내)의 댓글을 그룹화
+    timeline_data = {}
+    best_time, best_likes = None, -1
     
     current_group = None
-    for _, row in timestamp_comments.iterrows():
-        timestamp = row['timestamp']
+    for comment in timestamp_comments:
+        timestamp = comment['timestamp']
         
         # 새로운 그룹 시작 또는 기존 그룹에 추가
-        if current_group is None or abs(timestamp - current_group) > 5:
+        if current_group is None or timestamp - current_group > 5:
             current_group = timestamp
+            group = timeline_data[current_group] = {
+                'comments': [],
+                'total_likes': 0,
+                'representative_time': current_group
+            }
         
-        timeline_data[current_group]['comments'].append(row.to_dict())
-        timeline_data[current_group]['total_likes'] += row['likeCount']
-        timeline_data[current_group]['representative_time'] = current_group
+        group['comments'].append(comment)
+        group['total_likes'] += comment['likeCount']
+        
+        # 좋아요가 가장 많은 그룹을 집계하면서 함께 추적
+        if group['total_likes'] > best_likes:
+            best_time, best_likes = current_group, group['total_likes']
     
-    return timeline_data
+    return timeline_data, best_time
 
 def create_timestamp_link(url, seconds):
     """타임스탬프 링크 생성"""
@@ -230,7 +366,7 @@ def create_timestamp_link(url, seconds):
 
 def create_youtube_embed(url, start_time=0):
     """YouTube 임베드 iframe HTML 생성 (필요 시 사용)"""
-    video_id = url.split('watch?v=')[1].split('&')[0]
+    video_id = _extract_video_id(url)
     return f"""
         <iframe
             width="100%"
@@ -242,33 +378,39 @@ def create_youtube_embed(url, start_time=0):
         ></iframe>
     """
 
+# (기준값, 포맷 함수) - 큰 단위부터 검사
+_NUMBER_TIERS = (
+    (100000000, lambda num: f"{num//100000000}억 {(num%100000000)//10000}만"),  # 1억 이상
+    (10000, lambda num: f"{num//10000}만"),    # 1만 이상
+    (1000, lambda num: f"{num//1000}천"),      # 1천 이상
+)
+
+@functools.lru_cache(maxsize=2048)
 def format_number(num):
     """숫자를 읽기 쉬운 형식으로 변환 (예: 1000 -> 1천, 1000000 -> 100만)"""
-    if num >= 100000000:  # 1억 이상
-        return f"{num//100000000}억 {(num%100000000)//10000}만"
-    elif num >= 10000:    # 1만 이상
-        return f"{num//10000}만"
-    elif num >= 1000:     # 1천 이상
-        return f"{num//1000}천"
-    else:
-        return str(num)
+    for threshold, formatter in _NUMBER_TIERS:
+        if num >= threshold:
+            return formatter(num)
+    return str(num)
+
+_COMMENT_CARD_TMPL = """<div class="comment-card">
+    <div class="comment-header">
+        <span class="comment-author">{author}</span>
+        <span class="comment-likes">👍 {likes}</span>
+    </div>
+    <div class="comment-text">{text}</div>
+</div>"""
 
 def generate_comment_cards(comments):
-    """댓글 카드 HTML 생성"""
-    cards_html = ""
-    for comment in comments:
-        cards_html += f"""
-            <div class="comment-card">
-                <div class="comment-header">
-                    <span class="comment-author">{comment['authorDisplayName']}</span>
-                    <span class="comment-likes">👍 {comment['likeCount']}</span>
-                </div>
-                <div class="comment-text">
-                    {comment['text']}
-                </div>
-            </div>
-        """
-    return cards_html
+    """댓글 카드 HTML 생성 (작성자/본문은 HTML 이스케이프)"""
+    return "".join(
+        _COMMENT_CARD_TMPL.format(
+            author=escape(comment['authorDisplayName']),
+            likes=comment['likeCount'],
+            text=escape(comment['text']).replace('\n', '<br>')
+        )
+        for comment in comments
+    )
 
 def generate_share_buttons(url, timestamp):
     """공유 버튼 HTML 생성"""
@@ -303,10 +445,7 @@ def main():
     elif st.session_state.page == 'video':
         show_video_page()
 
-def show_home_page():
-    """홈페이지 표시"""
-    # 스타일 정의
-    st.markdown("""
+_HOME_CSS = """
         <style>
         /* 기본 설정 */
         :root {
@@ -445,7 +584,12 @@ def show_home_page():
             color: inherit !important;
         }
         </style>
-    """, unsafe_allow_html=True)
+"""
+
+def show_home_page():
+    """홈페이지 표시"""
+    # 스타일 정의
+    inject_css(_HOME_CSS)
     
     # 메인 타이틀과 설명
     st.markdown("""
@@ -488,11 +632,7 @@ def show_video_page():
     if hasattr(st.session_state, 'video_url'):
         process_video(st.session_state.video_url)
 
-def show_trending_videos():
-    trending_videos = get_trending_videos()
-    woosoo_videos = get_woosoo_videos()
-    
-    st.markdown("""
+_TRENDING_CSS = """
         <style>
         /* 섹션 헤더 */
         .section-header {
@@ -521,6 +661,13 @@ def show_trending_videos():
             gap: 0.75rem;
         }
         
+        /* 비디오 카드 그리드 (2열) */
+        .video-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 0 1rem;
+        }
+        
         /* 비디오 카드 */
         .video-card {
             background: rgba(45, 45, 45, 0.5);
@@ -598,191 +745,190 @@ def show_trending_videos():
             color: inherit !important;
         }
         </style>
-    """, unsafe_allow_html=True)
+"""
+
+def video_card_html(video):
+    """비디오 카드 HTML 생성 (제목은 HTML 이스케이프)"""
+    title = escape(video['title'])
+    return f"""<a href="{video['url']}" target="_blank">
+        <div class="video-card">
+            <div class="thumbnail-container">
+                <img src="{video['thumbnail']}" alt="{title}">
+            </div>
+            <div class="video-info">
+                <h3 class="video-title">{title}</h3>
+                <div class="meta-row">
+                    <span class="meta-badge">👀 {format_number(video['viewCount'])}</span>
+                    <span class="meta-badge">💬 {format_number(video['commentCount'])}</span>
+                </div>
+            </div>
+        </div>
+    </a>"""
+
+def render_video_section(title, videos):
+    """섹션 헤더와 비디오 카드 그리드를 한 번의 st.markdown으로 출력"""
+    cards_html = "".join(video_card_html(video) for video in videos[:4])
+    st.markdown(f"""<div class="section-header">
+        <h2 class="section-title">{title}</h2>
+    </div>
+    <div class="video-grid">{cards_html}</div>""", unsafe_allow_html=True)
+
+def show_trending_videos():
+    # 두 API 호출은 서로 독립적이므로 동시에 실행
+    executor = get_api_executor()
+    trending_future = executor.submit(get_trending_videos)
+    woosoo_future = executor.submit(get_woosoo_videos)
+    trending_videos, woosoo_videos = trending_future.result(), woosoo_future.result()
+    
+    inject_css(_TRENDING_CSS)
     
     # 웃소 최신 영상 섹션
     if woosoo_videos:
-        st.markdown("""
-            <div class="section-header">
-                <h2 class="section-title">😆 웃소 최신 영상</h2>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        cols = st.columns(2)
-        for idx, video in enumerate(woosoo_videos[:4]):
-            with cols[idx % 2]:
-                st.markdown(f"""
-                    <a href="{video['url']}" target="_blank">
-                        <div class="video-card">
-                            <div class="thumbnail-container">
-                                <img src="{video['thumbnail']}" alt="{video['title']}">
-                            </div>
-                            <div class="video-info">
-                                <h3 class="video-title">{video['title']}</h3>
-                                <div class="meta-row">
-                                    <span class="meta-badge">👀 {format_number(video['viewCount'])}</span>
-                                    <span class="meta-badge">💬 {format_number(video['commentCount'])}</span>
-                                </div>
-                            </div>
-                        </div>
-                    </a>
-                """, unsafe_allow_html=True)
+        render_video_section("😆 웃소 최신 영상", woosoo_videos)
     
     # 인기 급상승 동영상 섹션
     if trending_videos:
-        st.markdown("""
-            <div class="section-header">
-                <h2 class="section-title">🔥 인기 급상승 동영상</h2>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        cols = st.columns(2)
-        for idx, video in enumerate(trending_videos[:4]):
-            with cols[idx % 2]:
-                st.markdown(f"""
-                    <a href="{video['url']}" target="_blank">
-                        <div class="video-card">
-                            <div class="thumbnail-container">
-                                <img src="{video['thumbnail']}" alt="{video['title']}">
-                            </div>
-                            <div class="video-info">
-                                <h3 class="video-title">{video['title']}</h3>
-                                <div class="meta-row">
-                                    <span class="meta-badge">👀 {format_number(video['viewCount'])}</span>
-                                    <span class="meta-badge">💬 {format_number(video['commentCount'])}</span>
-                                </div>
-                            </div>
-                        </div>
-                    </a>
-                """, unsafe_allow_html=True)
+        render_video_section("🔥 인기 급상승 동영상", trending_videos)
+
+_VIDEO_CSS = """
+        <style>
+        .block-container {
+            max-width: 1600px !important;
+            padding: 2rem !important;
+        }
+
+        .video-player {
+            margin-bottom: 1rem;
+        }
+
+        .video-info-box {
+            background: rgba(255, 255, 255, 0.05);
+            border-radius: 16px;
+            padding: 1.5rem;
+            margin-top: 1rem;
+        }
+
+        .video-title {
+            font-size: 1.1rem;
+            color: white;
+            margin-bottom: 1rem;
+        }
+
+        .channel-name {
+            color: #B0B0B0;
+        }
+
+        .moment-card {
+            background: rgba(255, 255, 255, 0.08);
+            border-radius: 12px;
+            padding: 1rem;
+            margin-bottom: 1rem;
+        }
+
+        .moment-header {
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+            margin-bottom: 1rem;
+        }
+
+        .timestamp-badge {
+            background: #FF4B4B;
+            color: white !important;
+            padding: 0.5rem 1rem;
+            border-radius: 8px;
+            font-weight: 600;
+            cursor: pointer;
+            border: none;
+            transition: all 0.2s ease;
+        }
+
+        .timestamp-badge:hover {
+            background: #FF3333;
+            transform: translateY(-2px);
+        }
+
+        .stats {
+            display: flex;
+            gap: 0.5rem;
+        }
+
+        .stats span {
+            background: rgba(255, 255, 255, 0.1);
+            padding: 0.4rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+            color: #B0B0B0;
+        }
+
+        .comment-card {
+            background: rgba(255, 255, 255, 0.05);
+            border-radius: 8px;
+            padding: 1rem;
+            margin-bottom: 0.5rem;
+        }
+
+        .comment-header {
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 0.5rem;
+        }
+
+        .comment-author {
+            color: #B0B0B0;
+        }
+
+        .comment-text {
+            color: white;
+            line-height: 1.5;
+        }
+
+        /* Streamlit 기본 헤더 숨기기 */
+        header {
+            visibility: hidden;
+        }
+
+        /* 스크롤바 스타일링 */
+        ::-webkit-scrollbar {
+            width: 8px;
+        }
+
+        ::-webkit-scrollbar-track {
+            background: rgba(255, 255, 255, 0.05);
+        }
+
+        ::-webkit-scrollbar-thumb {
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 4px;
+        }
+
+        /* 타임라인 모먼트 섹션 스타일 */
+        h2 {
+            color: white;
+            margin-bottom: 1.5rem;
+            font-size: 1.5rem;
+        }
+        </style>
+"""
 
 def process_video(url):
+    # 스타일 정의
+    inject_css(_VIDEO_CSS)
+    
     try:
-        video_response = get_video_info(url)  # video_response만 받도록 수정
+        # 비디오 ID 추출
+        video_id = _extract_video_id(url)
+        if not video_id:
+            st.error("올바른 YouTube URL을 입력해주세요")
+            return
+        
+        # 영상 정보와 댓글을 동시에 가져오기
+        executor = get_api_executor()
+        info_future = executor.submit(get_video_info_by_id, video_id)
+        comments_future = executor.submit(get_comments, video_id)
+        video_response, comments = info_future.result(), comments_future.result()
         
         if video_response and video_response.get('items'):  # 체크 방식 수정
-            # 스타일 정의
-            st.markdown("""
-                <style>
-                .block-container {
-                    max-width: 1600px !important;
-                    padding: 2rem !important;
-                }
-                
-                .video-player {
-                    margin-bottom: 1rem;
-                }
-                
-                .video-info-box {
-                    background: rgba(255, 255, 255, 0.05);
-                    border-radius: 16px;
-                    padding: 1.5rem;
-                    margin-top: 1rem;
-                }
-                
-                .video-title {
-                    font-size: 1.1rem;
-                    color: white;
-                    margin-bottom: 1rem;
-                }
-                
-                .channel-name {
-                    color: #B0B0B0;
-                }
-                
-                .moment-card {
-                    background: rgba(255, 255, 255, 0.08);
-                    border-radius: 12px;
-                    padding: 1rem;
-                    margin-bottom: 1rem;
-                }
-                
-                .moment-header {
-                    display: flex;
-                    align-items: center;
-                    gap: 1rem;
-                    margin-bottom: 1rem;
-                }
-                
-                .timestamp-badge {
-                    background: #FF4B4B;
-                    color: white !important;
-                    padding: 0.5rem 1rem;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    cursor: pointer;
-                    border: none;
-                    transition: all 0.2s ease;
-                }
-                
-                .timestamp-badge:hover {
-                    background: #FF3333;
-                    transform: translateY(-2px);
-                }
-                
-                .stats {
-                    display: flex;
-                    gap: 0.5rem;
-                }
-                
-                .stats span {
-                    background: rgba(255, 255, 255, 0.1);
-                    padding: 0.4rem 0.8rem;
-                    border-radius: 20px;
-                    font-size: 0.9rem;
-                    color: #B0B0B0;
-                }
-                
-                .comment-card {
-                    background: rgba(255, 255, 255, 0.05);
-                    border-radius: 8px;
-                    padding: 1rem;
-                    margin-bottom: 0.5rem;
-                }
-                
-                .comment-header {
-                    display: flex;
-                    justify-content: space-between;
-                    margin-bottom: 0.5rem;
-                }
-                
-                .comment-author {
-                    color: #B0B0B0;
-                }
-                
-                .comment-text {
-                    color: white;
-                    line-height: 1.5;
-                }
-                
-                /* Streamlit 기본 헤더 숨기기 */
-                header {
-                    visibility: hidden;
-                }
-                
-                /* 스크롤바 스타일링 */
-                ::-webkit-scrollbar {
-                    width: 8px;
-                }
-                
-                ::-webkit-scrollbar-track {
-                    background: rgba(255, 255, 255, 0.05);
-                }
-                
-                ::-webkit-scrollbar-thumb {
-                    background: rgba(255, 255, 255, 0.1);
-                    border-radius: 4px;
-                }
-                
-                /* 타임라인 모먼트 섹션 스타일 */
-                h2 {
-                    color: white;
-                    margin-bottom: 1.5rem;
-                    font-size: 1.5rem;
-                }
-                </style>
-            """, unsafe_allow_html=True)
-            
             # JavaScript 함수를 components.html로 추가
             st.components.v1.html("""
                 <script>
@@ -798,23 +944,18 @@ def process_video(url):
                 </script>
             """, height=0)
             
-            # 비디오 ID 추출
-            video_id = url.split('watch?v=')[1].split('&')[0]
-            
             # 댓글 분석하여 최고 인기 타임스탬프 찾기
-            comments_df = get_comments(video_id)  # video.video_id 대신 video_id 사용
             start_time = 0
             timeline_data = {}
             current_time = st.session_state.get('current_time', 0)
             
-            if not comments_df.empty:
-                comments_df['timestamp'] = comments_df['text'].apply(parse_timestamp)
-                timeline_data = aggregate_timeline_comments(comments_df)
+            if comments:
+                for comment in comments:
+                    comment['timestamp'] = parse_timestamp(comment['text'])
+                timeline_data, most_liked_time = aggregate_timeline_comments(comments)
                 
-                if timeline_data:
-                    most_liked_moment = max(timeline_data.items(), 
-                                         key=lambda x: x[1]['total_likes'])
-                    start_time = most_liked_moment[0]
+                if most_liked_time is not None:
+                    start_time = int(most_liked_time)
             
             # 레이아웃 설정
             col1, col2 = st.columns([1, 1])
@@ -843,16 +984,15 @@ def process_video(url):
                 st.markdown('<h2>🎯 인기 타임라인 모먼트</h2>', unsafe_allow_html=True)
                 
                 if timeline_data:
-                    for time, data in sorted(timeline_data.items(), 
-                                          key=lambda x: x[1]['total_likes'], 
-                                          reverse=True)[:10]:
+                    for moment_time, data in heapq.nlargest(10, timeline_data.items(), 
+                                                            key=lambda x: x[1]['total_likes']):
                         col_time, col_stats = st.columns([1, 2])
                         
                         with col_time:
-                            if st.button(f"🕒 {seconds_to_timestamp(time)}", 
-                                       key=f"time_{time}",
+                            if st.button(f"🕒 {seconds_to_timestamp(moment_time)}", 
+                                       key=f"time_{moment_time}",
                                        use_container_width=True):
-                                st.session_state.current_time = int(time)
+                                st.session_state.current_time = int(moment_time)
                                 st.rerun()
                         
                         with col_stats:
@@ -864,21 +1004,13 @@ def process_video(url):
                             """, unsafe_allow_html=True)
                             
                         # 댓글 표시
-                        for comment in data['comments']:
-                            st.markdown(f"""
-                                <div class="comment-card">
-                                    <div class="comment-header">
-                                        <span class="comment-author">{comment['authorDisplayName']}</span>
-                                        <span class="comment-likes">👍 {comment['likeCount']}</span>
-                                    </div>
-                                    <div class="comment-text">{comment['text']}</div>
-                                </div>
-                            """, unsafe_allow_html=True)
+                        st.markdown(generate_comment_cards(data['comments']), unsafe_allow_html=True)
                 else:
                     st.info("타임스탬프가 포함된 댓글이 없습니다.")
                                 
     except Exception as e:
         st.error(f"오류가 발생했습니다: {str(e)}")
+        import traceback  # 오류 경로에서만 필요
         logger.error(f"비디오 처리 중 오류 발생: {str(e)}\n{traceback.format_exc()}")
 
 if __name__ == "__main__":
@@ -1,26 +1,30 @@
 import streamlit as st
-import pytube
 from googleapiclient.discovery import build
-import pandas as pd
+from googleapiclient.http import HttpRequest
 import re
-from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from pathlib import Path
+from datetime import timedelta
 import json
-from collections import defaultdict
+from operator import itemgetter
+import bisect
+import functools
 import logging
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import traceback
-import ssl
-import certifi
-import os
+from html import escape
 import openai
-from dotenv import load_dotenv
+try:
+    import diskcache  # API 응답 디스크 캐시 (없으면 캐시 없이 동작)
+except ImportError:
+    diskcache = None
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# 환경 변수 로드 부분 수정
-# load_dotenv() 제거
-
 # API 키 체크
 if not st.secrets.get("YOUTUBE_API_KEY"):
     st.error("YouTube API 키가 설정되지 않았습니다. 관리자에게 문의하세요.")
@@ -32,73 +36,192 @@ if not st.secrets.get("OPENAI_API_KEY"):
 
 # YouTube API 키 설정
 YOUTUBE_API_KEY = st.secrets["YOUTUBE_API_KEY"]
-youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+
+# API 응답 디스크 캐시 유효 시간 (가장 짧은 st.cache_data TTL과 동일)
+_API_CACHE_TTL = 3600
+
+# 디스크 캐시 경로 (메인 페이지와 같은 ~/.cache/das 아래)
+_DISK_CACHE_DIR = Path.home() / '.cache' / 'das'
+
+@st.cache_resource
+def _api_response_cache():
+    """YouTube API 응답 디스크 캐시 (요청 URL -> 응답, 재시작/워커 간 공유)"""
+    return diskcache.Cache(str(_DISK_CACHE_DIR / 'api'))
+
+def _cache_key(uri):
+    """요청 URL에서 API 키(key 파라미터)를 제거한 캐시 키 (디스크에 키가 평문으로 남지 않도록)"""
+    parts = urlsplit(uri)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'key'])
+    return urlunsplit(parts._replace(query=query))
+
+class CachedHttpRequest(HttpRequest):
+    """GET 요청 응답을 전체 요청 URL 기준으로 디스크에 캐시하는 HttpRequest"""
+    def execute(self, http=None, num_retries=0):
+        if diskcache is None or self.method != 'GET':
+            return super().execute(http=http, num_retries=num_retries)
+        
+        cache = _api_response_cache()
+        key = _cache_key(self.uri)
+        response = cache.get(key)
+        if response is None:
+            response = super().execute(http=http, num_retries=num_retries)
+            cache.set(key, response, expire=_API_CACHE_TTL)
+        return response
+
+@st.cache_resource(show_spinner=False)
+def get_api_executor():
+    """YouTube API 호출용 스레드 풀 (재실행/세션 간 공유되어 스레드별 클라이언트가 유지됨)"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='youtube-api')
+
+@st.cache_resource(show_spinner=False)
+def _youtube_clients():
+    """스레드별 YouTube API 클라이언트 저장소 (재실행 간 유지)"""
+    return threading.local()
+
+def get_youtube():
+    """현재 스레드 전용 YouTube API 클라이언트 반환 (httplib2는 스레드 안전하지 않음)"""
+    clients = _youtube_clients()
+    client = getattr(clients, 'youtube', None)
+    if client is None:
+        client = clients.youtube = build(
+            'youtube', 'v3',
+            developerKey=YOUTUBE_API_KEY,
+            requestBuilder=CachedHttpRequest
+        )
+    return client
 
 # OpenAI API 키 설정
 OPENAI_API_KEY = st.secrets["OPENAI_API_KEY"]
 openai.api_key = OPENAI_API_KEY
 
+@st.cache_resource
+def get_openai_client():
+    """OpenAI 클라이언트 (재실행 간 공유되어 keep-alive 연결 재사용)"""
+    return openai.OpenAI(api_key=OPENAI_API_KEY)
+
+# 정규식 패턴 (모듈 로드 시 한 번만 컴파일)
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_TS_RE = re.compile(r'(?:(\d{1,2}):)?(\d{1,2}):(\d{2})')
+_VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|embed/)([\w-]{11})')
+_BARE_VIDEO_ID_RE = re.compile(r'[\w-]{11}')
+
+def _extract_video_id(url):
+    """YouTube URL에서 video_id 추출 (watch?v=, youtu.be/, embed/ 형식 지원, ID가 들어오면 그대로 반환)"""
+    if _BARE_VIDEO_ID_RE.fullmatch(url):
+        return url
+    
+    # 가장 흔한 watch?v= 형식은 partition으로 바로 처리 (리스트 할당 없음)
+    _, sep, tail = url.partition('watch?v=')
+    if sep:
+        video_id = tail[:11]
+        # 잘라낸 11글자가 올바른 ID일 때만 사용 (아니면 정규식으로 처리)
+        if _BARE_VIDEO_ID_RE.fullmatch(video_id):
+            return video_id
+    
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else ''
+
 def parse_duration(duration):
     """YouTube API의 duration 문자열을 초 단위로 변환"""
-    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
+    match = _DURATION_RE.match(duration)
     if not match:
         return 0
     
-    hours = int(match.group(1) or 0)
-    minutes = int(match.group(2) or 0)
-    seconds = int(match.group(3) or 0)
+    hours, minutes, seconds = match.groups(0)
     
-    return hours * 3600 + minutes * 60 + seconds
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+# videos.list 공통 필드 마스크 (카드와 상세 화면에서 쓰는 값만 요청)
+_VIDEO_FIELDS = "items(id,snippet(title,channelTitle,thumbnails/high/url),statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+
+# ID별 영상 정보 유지 시간 (이보다 오래된 항목은 저장할 때 정리)
+_VIDEO_STORE_TTL = 3600
+
+@st.cache_resource
+def _video_details_store():
+    """video_id -> (저장 시각, videos.list item) 공용 캐시 (세션 간 공유)"""
+    return {}
+
+def _remember_videos(items):
+    """videos.list 응답 item들을 ID별 캐시에 저장 (만료된 항목은 제거해 메모리가 계속 늘지 않도록)"""
+    store = _video_details_store()
+    now = time.time()
+    # 다른 스레드가 동시에 저장할 수 있으므로 스냅샷을 순회하며 제거
+    for video_id, (saved_at, _) in list(store.items()):
+        if now - saved_at >= _VIDEO_STORE_TTL:
+            store.pop(video_id, None)
+    for item in items:
+        store[item['id']] = (now, item)
+
+def fetch_videos_bulk(video_ids, ttl=_VIDEO_STORE_TTL):
+    """여러 영상 정보를 videos.list 한 번으로 가져오기 (캐시에 없는 ID만 요청, 최대 50개)"""
+    store = _video_details_store()
+    now = time.time()
+    
+    details = {}
+    missing_ids = []
+    for video_id in video_ids:
+        cached = store.get(video_id)
+        if cached and now - cached[0] < ttl:
+            details[video_id] = cached[1]
+        else:
+            missing_ids.append(video_id)
+    
+    if missing_ids:
+        response = get_youtube().videos().list(
+            part="snippet,statistics,contentDetails",
+            id=','.join(missing_ids[:50]),
+            fields=_VIDEO_FIELDS
+        ).execute()
+        items = response.get('items', [])
+        _remember_videos(items)
+        details.update((item['id'], item) for item in items)
+    
+    return details
+
+def _video_data(item):
+    """videos.list 응답 item을 비디오 카드용 딕셔너리로 변환"""
+    return {
+        'id': item['id'],
+        'title': item['snippet']['title'],
+        'thumbnail': item['snippet']['thumbnails']['high']['url'],
+        'url': f"https://www.youtube.com/watch?v={item['id']}",
+        'viewCount': int(item['statistics'].get('viewCount', 0)),
+        'commentCount': int(item['statistics'].get('commentCount', 0))
+    }
 
 @st.cache_data(ttl=86400)  # 24시간 캐시
 def get_trending_videos():
     """인기 급상승 동영상 가져오기"""
     try:
-        request = youtube.videos().list(
-            part="snippet,statistics",
+        # 인기 차트 응답에 상세 정보가 이미 포함되므로 ID별 캐시에도 저장
+        request = get_youtube().videos().list(
+            part="snippet,statistics,contentDetails",
             chart="mostPopular",
             regionCode="KR",
             maxResults=4,
-            fields="items(id,snippet(title,channelTitle,thumbnails/high/url),statistics(viewCount,commentCount))"
+            fields=_VIDEO_FIELDS
         )
         
         response = request.execute()
-        trending_videos = []
+        _remember_videos(response['items'])
         
-        for item in response['items']:
-            video_data = {
-                'id': item['id'],
-                'title': item['snippet']['title'],
-                'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                'url': f"https://www.youtube.com/watch?v={item['id']}",
-                'viewCount': int(item['statistics']['viewCount']),
-                'commentCount': int(item['statistics'].get('commentCount', 0))
-            }
-            trending_videos.append(video_data)
-        
-        return trending_videos
+        return [_video_data(item) for item in response['items']]
         
     except Exception as e:
         logger.error(f"인기 동영상 가져오기 실패: {str(e)}")
         return []
 
 @st.cache_data(ttl=86400)  # 24시간 캐시
-def get_video_info(url):
-    """YouTube 영상 정보를 가져오는 함수"""
+def get_video_info(url_or_id):
+    """YouTube 영상 정보를 가져오는 함수 (URL 또는 video_id)"""
     try:
-        # URL 형식에 따라 video_id 추출
-        if "youtu.be" in url:
-            video_id = url.split('/')[-1]
-        else:
-            video_id = url.split('watch?v=')[1].split('&')[0]
+        video_id = _extract_video_id(url_or_id)
         
-        video_response = youtube.videos().list(
-            part='snippet,statistics',
-            id=video_id,
-            fields='items(snippet(title,channelTitle),statistics(viewCount,likeCount,commentCount))'
-        ).execute()
+        # 인기/웃소 영상으로 이미 받아온 ID면 HTTP 요청 없이 캐시에서 반환
+        item = fetch_videos_bulk([video_id]).get(video_id)
         
-        return video_response
+        return {'items': [item] if item else []}
         
     except Exception as e:
         logger.error(f"영상 정보 가져오기 실패: {str(e)}")
@@ -110,38 +233,31 @@ def get_woosoo_videos():
     try:
         channel_id = "UCmzMtXrJgfCqA0rfhz8_P4A"
         
-        request = youtube.search().list(
-            part="snippet",
+        # 검색 결과에서는 ID만 사용 (상세 정보와 길이는 videos.list에서 확인)
+        request = get_youtube().search().list(
+            part="id",
             channelId=channel_id,
             order="date",
             maxResults=15,
-            type="video"
+            type="video",
+            fields="items/id/videoId"
         )
         response = request.execute()
         
         video_ids = [item['id']['videoId'] for item in response['items']]
-        
-        videos_request = youtube.videos().list(
-            part="snippet,statistics,contentDetails",
-            id=','.join(video_ids)
-        )
-        videos_response = videos_request.execute()
+        video_details = fetch_videos_bulk(video_ids)
         
         woosoo_videos = []
-        for item in videos_response['items']:
+        for video_id in video_ids:
+            item = video_details.get(video_id)
+            if item is None:
+                continue
+            
             duration = item['contentDetails']['duration']
             duration_seconds = parse_duration(duration)
             
             if duration_seconds > 61:
-                video_data = {
-                    'id': item['id'],
-                    'title': item['snippet']['title'],
-                    'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                    'url': f"https://www.youtube.com/watch?v={item['id']}",
-                    'viewCount': int(item['statistics'].get('viewCount', 0)),
-                    'commentCount': int(item['statistics'].get('commentCount', 0))
-                }
-                woosoo_videos.append(video_data)
+                woosoo_videos.append(_video_data(item))
         
         return woosoo_videos[:4]
             
@@ -153,13 +269,13 @@ def get_woosoo_videos():
 def get_comments(video_id):
     """YouTube 비디오의 댓글을 가져오는 함수"""
     try:
-        request = youtube.commentThreads().list(
+        request = get_youtube().commentThreads().list(
             part="snippet",
             videoId=video_id,
             maxResults=30,
             order="relevance",
             textFormat="plainText",
-            fields="items(snippet/topLevelComment/snippet(textDisplay,authorDisplayName,likeCount,publishedAt))"
+            fields="items(snippet/topLevelComment/snippet(textDisplay,authorDisplayName,likeCount))"
         )
         
         comments_list = []
@@ -170,129 +286,126 @@ def get_comments(video_id):
                 comments_list.append({
                     'text': comment['textDisplay'],
                     'authorDisplayName': comment['authorDisplayName'],
-                    'likeCount': comment.get('likeCount', 0),
-                    'publishedAt': comment['publishedAt']
+                    'likeCount': comment.get('likeCount', 0)
                 })
         except Exception as api_error:
             logger.warning(f"API를 통한 댓글 가져오기 실패: {str(api_error)}")
         
-        return pd.DataFrame(comments_list)
+        return comments_list
         
     except Exception as e:
         logger.error(f"댓글 가져오기 실패: {str(e)}")
-        return pd.DataFrame()
+        return []
 
 def parse_timestamp(text):
     """댓글에서 타임스탬프를 추출하는 함수"""
     try:
         # HH:MM:SS 또는 MM:SS 형식의 타임스탬프 찾기
-        timestamp_pattern = r'(\d{1,2}:)?\d{1,2}:\d{2}'
-        match = re.search(timestamp_pattern, text)
+        match = _TS_RE.search(text)
         
         if match:
-            timestamp = match.group(0)
-            # 시간을 초로 변환
-            time_parts = timestamp.split(':')
-            if len(time_parts) == 2:
-                minutes, seconds = map(int, time_parts)
-                total_seconds = minutes * 60 + seconds
-            else:
-                hours, minutes, seconds = map(int, time_parts)
-                total_seconds = hours * 3600 + minutes * 60 + seconds
-            return total_seconds
+            # 캡처된 시/분/초를 바로 초로 변환
+            hours, minutes, seconds = match.groups(0)
+            return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
         return None
     except Exception as e:
         logger.error(f"타임스탬프 파싱 실패: {str(e)}")
     return None
 
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(seconds):
+    """정수 초를 HH:MM:SS 문자열로 변환 (성공한 결과만 캐시)"""
+    return str(timedelta(seconds=seconds))
+
 def seconds_to_timestamp(seconds):
     """초를 타임스탬프 형식(HH:MM:SS)으로 변환하는 함수"""
     try:
-        return str(timedelta(seconds=int(seconds)))
+        return _format_seconds(int(seconds))
     except Exception as e:
         logger.error(f"초 변환 실패: {str(e)}")
         return "00:00:00"
 
-def aggregate_timeline_comments(df):
+def aggregate_timeline_comments(comments):
     """타임스탬프별 댓글을 집계하는 함수"""
-    # 타임스탬프가 있는 댓글만 필터링
-    timestamp_comments = df[df['timestamp'].notna()].copy()
-    
-    if len(timestamp_comments) == 0:
-        return {}
-    
-    # 비슷한 시간대(5초 이내)의 댓글을 그룹화
-    timeline_data = defaultdict(lambda: {'comments': [], 'total_likes': 0, 'representative_time': 0})
-    
-    # 타임스탬프로 정렬
-    timestamp_comments = timestamp_comments.sort_values('timestamp')
+    # 타임스탬프가 있는 댓글만 필터링 후 타임스탬프로 정렬
+    timestamp_comments = sorted(
+        (comment for comment in comments if comment['timestamp'] is not None),
+        key=itemgetter('timestamp')
+    )
     
+    # 비슷한 시간대(5초 이내)의 댓글을 한 번의 순회로 그룹화
+    groups = []
     current_group = None
-    for _, row in timestamp_comments.iterrows():
-        timestamp = row['timestamp']
-        
-        # 새로운 그룹 시작 또는 기존 그룹에 추가
-        if current_group is None or abs(timestamp - current_group) > 5:
-            current_group = timestamp
+    for comment in timestamp_comments:
+        timestamp = comment['timestamp']
         
-        timeline_data[current_group]['comments'].append(row.to_dict())
-        timeline_data[current_group]['total_likes'] += row['likeCount']
-        timeline_data[current_group]['representative_time'] = current_group
+        # 대표 시간에서 5초 넘게 벗어나면 새로운 그룹 시작
+        if current_group is None or timestamp - current_group['representative_time'] > 5:
+            current_group = {'comments': [], 'total_likes': 0, 'representative_time': timestamp}
+            groups.append(current_group)
         
-        # 각 그룹 내에서 댓글을 좋아요 순으로 정렬
-        timeline_data[current_group]['comments'].sort(
-            key=lambda x: x['likeCount'], 
-            reverse=True
-        )
+        current_group['comments'].append(comment)
+        current_group['total_likes'] += comment['likeCount']
+    
+    # 각 그룹 내에서 댓글을 좋아요 순으로 한 번만 정렬
+    for group in groups:
+        group['comments'].sort(key=itemgetter('likeCount'), reverse=True)
     
-    return timeline_data
+    return {group['representative_time']: group for group in groups}
 
+@functools.lru_cache(maxsize=1024)
 def create_timestamp_link(url, seconds):
     """타임스탬프 링크 생성"""
     base_url = url.split('&t=')[0]  # 기존 타임스탬프 제거
     return f"{base_url}&t={int(seconds)}s"
 
-def create_youtube_embed(url, start_time=0):
-    """YouTube 임베드 iframe HTML 생성 (필요 시 사용)"""
-    video_id = url.split('watch?v=')[1].split('&')[0]
-    return f"""
-        <iframe
-            width="100%"
-            height="400"
-            src="https://www.youtube.com/embed/{video_id}?enablejsapi=1&start={start_time}&autoplay=1"
-            frameborder="0"
-            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
-            allowfullscreen
-        ></iframe>
-    """
+# HTML 템플릿 (모듈 로드 시 한 번만 정의, 다른 HTML 블록 안에 끼워 넣어도 빈 줄이 생기지 않도록 앞뒤 줄바꿈 없음)
+_EMBED_TMPL = """<iframe
+    name="yt-player"
+    width="100%"
+    height="500"
+    src="https://www.youtube.com/embed/{video_id}?enablejsapi=1&start={start_time}&autoplay=1"
+    frameborder="0"
+    allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
+    allowfullscreen
+></iframe>"""
+
+def create_youtube_embed(url_or_id, start_time=0):
+    """YouTube 임베드 iframe HTML 생성 (타임스탬프 링크가 name="yt-player"로 이동)"""
+    return _EMBED_TMPL.format(video_id=_extract_video_id(url_or_id), start_time=start_time)
 
+# 구간 경계와 구간별 포맷 함수 (bisect_right 결과로 바로 인덱싱)
+_NUMBER_THRESHOLDS = (1000, 10000, 100000000)
+_NUMBER_FORMATTERS = (
+    str,                                                            # 1천 미만
+    lambda num: f"{num//1000}천",                                   # 1천 이상
+    lambda num: f"{num//10000}만",                                  # 1만 이상
+    lambda num: f"{num//100000000}억 {(num%100000000)//10000}만",   # 1억 이상
+)
+
+@functools.lru_cache(maxsize=1024)
 def format_number(num):
     """숫자를 읽기 쉬운 형식으로 변환 (예: 1000 -> 1천, 1000000 -> 100만)"""
-    if num >= 100000000:  # 1억 이상
-        return f"{num//100000000}억 {(num%100000000)//10000}만"
-    elif num >= 10000:    # 1만 이상
-        return f"{num//10000}만"
-    elif num >= 1000:     # 1천 이상
-        return f"{num//1000}천"
-    else:
-        return str(num)
+    return _NUMBER_FORMATTERS[bisect.bisect_right(_NUMBER_THRESHOLDS, num)](num)
+
+_COMMENT_CARD_TMPL = """<div class="comment-card">
+    <div class="comment-header">
+        <span class="comment-author">{author}</span>
+        <span class="comment-likes">👍 {likes}</span>
+    </div>
+    <div class="comment-text">{text}</div>
+</div>"""
 
 def generate_comment_cards(comments):
-    """댓글 카드 HTML 생성"""
-    cards_html = ""
-    for comment in comments:
-        cards_html += f"""
-            <div class="comment-card">
-                <div class="comment-header">
-                    <span class="comment-author">{comment['authorDisplayName']}</span>
-                    <span class="comment-likes">👍 {comment['likeCount']}</span>
-                </div>
-                <div class="comment-text">
-                    {comment['text']}
-                </div>
-            </div>
-        """
-    return cards_html
+    """댓글 카드 HTML 생성 (작성자/본문은 HTML 이스케이프)"""
+    return "".join(
+        _COMMENT_CARD_TMPL.format(
+            author=escape(comment['authorDisplayName']),
+            likes=comment['likeCount'],
+            text=escape(comment['text']).replace('\n', '<br>')
+        )
+        for comment in comments
+    )
 
 def generate_share_buttons(url, timestamp):
     """공유 버튼 HTML 생성"""
@@ -315,50 +428,61 @@ def generate_share_buttons(url, timestamp):
         </a>
     """
 
+def generate_short_form_title(video_id, top_moments):
+    """상위 타임라인 그룹별로 숏폼 제목 생성 (좋아요 순으로 정렬된 구간들을 한 번의 API 호출로 처리)"""
+    if not top_moments:
+        return None
+    
+    # 캐시 키는 댓글 전체 대신 구간 시각 + 상위 댓글 작성자로 만든 시그니처 사용
+    signature = tuple(
+        (moment_time, tuple(comment['authorDisplayName'] for comment in data['comments'][:5]))
+        for moment_time, data in top_moments
+    )
+    return _generate_titles_cached(video_id, signature, top_moments)
+
 @st.cache_data(ttl=86400)  # 24시간 캐시
-def generate_short_form_title(timeline_data):
-    """각 타임라인 그룹별로 숏폼 제목 생성"""
+def _generate_titles_cached(video_id, signature, _top_moments):
+    """OpenAI로 구간별 숏폼 제목 생성 (video_id, signature로만 캐시, _top_moments는 해시하지 않음)"""
     try:
-        # 좋아요 순으로 상위 3개 그룹 선택
-        top_moments = sorted(
-            timeline_data.items(),
-            key=lambda x: x[1]['total_likes'],
-            reverse=True
-        )[:3]
+        # 구간별 댓글을 하나의 메시지로 묶음
+        timestamps = [seconds_to_timestamp(moment_time) for moment_time, _ in _top_moments]
+        sections = []
+        for idx, ((_, data), timestamp) in enumerate(zip(_top_moments, timestamps), start=1):
+            comments = "\n".join(comment['text'] for comment in data['comments'])
+            sections.append(f"[{idx}] {timestamp}\n{comments}")
         
-        titles = []
-        for time, data in top_moments:
-            # 해당 시간대의 모든 댓글 수집
-            comments = [comment['text'] for comment in data['comments']]
-            timestamp = seconds_to_timestamp(time)
+        try:
+            response = get_openai_client().chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": """당신은 YouTube 숏폼 콘텐츠의 제목을 생성하는 전문가입니다.
+                     특히 '웃소' 채널의 특성을 잘 이해하고 있습니다:
+                     - 웃소는 다양한 콘텐츠(상황극, 게임, 먹방, 브이로그)를 통해 멤버 간의 유머와 개성을 보여주는 코미디 유튜브 채널입니다.
+                     - 구독자들은 웃소 멤버들의 티키타카(재치 있는 대화)와 독특한 캐릭터성을 좋아합니다.
+                     - 멤버들: 해리, 태훈, 성희, 고탱, 우디, 디투, 소정 등
+                     또한, 한국의 밈을 잘 이해하고 있고, 무심한 듯한 유머를 이해합니다.
+                     응답은 항상 {"titles": ["제목1", "제목2", ...]} 형식의 JSON으로, 구간 순서대로 반환합니다.
+                     """},
+                    {"role": "user", "content": f"다음은 영상의 {len(sections)}개 구간에서 나온 시청자 댓글들입니다. "
+                     "각 구간마다 댓글들 중 간결하고 임팩트 있는 댓글을 하나 뽑아 한 줄 제목으로 활용해주세요. "
+                     "ex: 20:01 키노피오가되. > 키노피오가 되. \n\n" + "\n\n".join(sections)}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.7,
+                max_tokens=100 * len(sections)
+            )
             
-            try:
-                client = openai.OpenAI(api_key=OPENAI_API_KEY)
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": """당신은 YouTube 숏폼 콘텐츠의 제목을 생성하는 전문가입니다.
-                         특히 '웃소' 채널의 특성을 잘 이해하고 있습니다:
-                         - 웃소는 다양한 콘텐츠(상황극, 게임, 먹방, 브이로그)를 통해 멤버 간의 유머와 개성을 보여주는 코미디 유튜브 채널입니다.
-                         - 구독자들은 웃소 멤버들의 티키타카(재치 있는 대화)와 독특한 캐릭터성을 좋아합니다.
-                         - 멤버들: 해리, 태훈, 성희, 고탱, 우디, 디투, 소정 등
-                         또한, 한국의 밈을 잘 이해하고 있고, 무심한 듯한 유머를 이해합니다.                   
-                         """},
-                        {"role": "user", "content": f"다음은 영상의 {timestamp} 부근에서 나온 시청자 댓글들입니다. "
-                         f"이 댓글들 중 간결하고 임팩트 있는 댓글을 하나 뽑아 제목으로 활용해주세요. ex: 20:01 키노피오가되. > 키노피오가 되. \n\n{'\n'.join(comments)}"}
-                    ],
-                    temperature=0.7,
-                    max_tokens=100
-                )
-                
-                title = response.choices[0].message.content
-                # 줄바꿈 문자를 공백으로 대체하여 한 줄로 만듦
-                title = title.strip().replace('\n', ' ')
-                titles.append(f"🎬 {timestamp} - {title}")
-                
-            except Exception as api_error:
-                logger.error(f"OpenAI API 호출 실패: {str(api_error)}\n{traceback.format_exc()}")
-                continue
+            generated = json.loads(response.choices[0].message.content).get('titles', [])
+            
+        except Exception as api_error:
+            logger.error(f"OpenAI API 호출 실패: {str(api_error)}\n{traceback.format_exc()}")
+            return None
+        
+        titles = []
+        for timestamp, title in zip(timestamps, generated):
+            # 줄바꿈 문자를 공백으로 대체하여 한 줄로 만듦
+            title = str(title).strip().replace('\n', ' ')
+            titles.append(f"🎬 {timestamp} - {title}")
         
         # 각 제목 사이에 한 번의 줄바꿈만 추가
         return "\n".join(titles) if titles else None
@@ -367,10 +491,157 @@ def generate_short_form_title(timeline_data):
         logger.error(f"제목 생성 실패: {str(e)}\n{traceback.format_exc()}")
         return None
 
+_MOMENT_TMPL = """<div class="moment-header">
+    <a class="timestamp-badge" target="yt-player"
+       href="https://www.youtube.com/embed/{video_id}?start={seconds}&autoplay=1">🕒 {timestamp}</a>
+    <div class="stats">
+        <span>👍 {total_likes}개</span>
+        <span>💬 {comment_count}개</span>
+    </div>
+</div>
+{comment_cards}"""
+
+def display_moment(video_id, moment_time, data):
+    """타임라인 모먼트 하나(이동 링크, 통계, 댓글)의 HTML 반환"""
+    # 버튼 + st.rerun() 대신 플레이어 iframe(name="yt-player")을 대상으로 하는 링크로 이동
+    # (스크립트 재실행 없이 브라우저에서 바로 해당 시점부터 재생)
+    return _MOMENT_TMPL.format(
+        video_id=video_id,
+        seconds=int(moment_time),
+        timestamp=seconds_to_timestamp(moment_time),
+        total_likes=data['total_likes'],
+        comment_count=len(data['comments']),
+        comment_cards=generate_comment_cards(data['comments'])
+    )
+
+def display_timeline_moments(video_id, moments):
+    """좋아요 순으로 정렬된 타임라인 모먼트 표시 (전체를 한 번의 st.markdown으로 출력)"""
+    st.markdown(
+        "".join(display_moment(video_id, moment_time, data) for moment_time, data in moments),
+        unsafe_allow_html=True
+    )
+
+# 전역 스타일 (페이지 CSS보다 나중에 출력되어 !important 규칙이 우선 적용됨)
+_GLOBAL_CSS = """
+    <style>
+    /* 전체 텍스트 색상 오버라이드 */
+    .stMarkdown, .stMarkdown p, h1, h2, h3, h4, h5, h6, .stTextInput label, .stSelectbox label {
+        color: #FFFFFF !important;
+    }
+    
+    /* URL 입력 필드 레이블 */
+    .stTextInput > label {
+        color: #FFFFFF !important;
+        font-size: 1rem !important;
+        font-weight: 500 !important;
+    }
+    
+    /* 입력 필드 스타일링 */
+    .stTextInput > div > div {
+        background-color: rgba(255, 255, 255, 0.05) !important;
+        border-color: rgba(255, 255, 255, 0.1) !important;
+        color: #FFFFFF !important;
+    }
+    
+    .stTextInput > div > div:hover {
+        border-color: rgba(255, 75, 75, 0.5) !important;
+    }
+    
+    .stTextInput > div > div:focus-within {
+        border-color: #FF4B4B !important;
+    }
+    
+    /* 타임코드 하이퍼링크 박스 */
+    .timestamp-badge {
+        background: rgba(255, 75, 75, 0.1) !important;
+        color: #FF4B4B !important;
+        border: 1px solid rgba(255, 75, 75, 0.2) !important;
+    }
+    
+    .timestamp-badge:hover {
+        background: rgba(255, 75, 75, 0.2) !important;
+        border-color: rgba(255, 75, 75, 0.3) !important;
+    }
+    
+    /* 홈으로 버튼 */
+    .stButton > button[kind="secondary"] {
+        background-color: rgba(255, 255, 255, 0.1) !important;
+        color: #FFFFFF !important;
+        border: 1px solid rgba(255, 255, 255, 0.1) !important;
+    }
+    
+    .stButton > button[kind="secondary"]:hover {
+        background-color: rgba(255, 255, 255, 0.15) !important;
+        border-color: rgba(255, 255, 255, 0.2) !important;
+    }
+    
+    /* 섹션 헤더 (인기 타임라인 모먼트 등) */
+    .section-header h2 {
+        color: #FFFFFF !important;
+        font-size: 1.5rem !important;
+        font-weight: 600 !important;
+        margin-bottom: 1.5rem !important;
+    }
+    
+    /* 에러 메시지 */
+    .stAlert {
+        background-color: rgba(255, 75, 75, 0.1) !important;
+        color: #FF4B4B !important;
+    }
+    
+    /* 비디오 제목 */
+    .video-title {
+        color: #FFFFFF !important;
+        font-size: 1.5rem !important;
+        font-weight: 600 !important;
+        line-height: 1.4 !important;
+    }
+    
+    /* 채널명 */
+    .channel-name {
+        color: rgba(255, 255, 255, 0.7) !important;
+        font-size: 0.9rem !important;
+    }
+    
+    /* 로딩 스피너 */
+    .stSpinner > div {
+        border-color: #FF4B4B !important;
+    }
+    
+    /* 스크롤바 */
+    ::-webkit-scrollbar-track {
+        background: rgba(255, 255, 255, 0.05) !important;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: rgba(255, 255, 255, 0.1) !important;
+    }
+    
+    ::-webkit-scrollbar-thumb:hover {
+        background: rgba(255, 255, 255, 0.2) !important;
+    }
+    
+    /* Deploy 바 숨기기 */
+    .stApp > header {
+        display: none !important;
+    }
+    </style>
+"""
+
+def set_global_styles():
+    """전역 스타일 출력"""
+    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
+
 def main():
     # 페이지 상태 관리
     if 'page' not in st.session_state:
-        st.session_state.page = 'home'
+        # ?v=<영상 ID> 로 들어온 경우 바로 비디오 페이지 표시 (딥링크)
+        video_id = st.query_params.get("v")
+        if video_id:
+            st.session_state.video_url = f"https://www.youtube.com/watch?v={video_id}"
+            st.session_state.page = 'video'
+        else:
+            st.session_state.page = 'home'
     
     # 홈페이지
     if st.session_state.page == 'home':
@@ -378,6 +649,8 @@ def main():
     # 비디오 페이지
     elif st.session_state.page == 'video':
         show_video_page()
+    
+    set_global_styles()
 
 def show_home_page():
     """홈페이지 표시"""
@@ -526,17 +799,14 @@ def show_video_page():
     # 뒤로가기 버튼
     if st.button('← 홈으로', key='back_button'):
         st.session_state.page = 'home'
+        st.query_params.clear()
         st.rerun()
     
     # 비디오 콘텐츠
     if hasattr(st.session_state, 'video_url'):
         process_video(st.session_state.video_url)
 
-def show_trending_videos():
-    trending_videos = get_trending_videos()
-    woosoo_videos = get_woosoo_videos()
-    
-    st.markdown("""
+_TRENDING_CSS = """
         <style>
         /* 섹션 헤더 */
         .section-header {
@@ -642,7 +912,49 @@ def show_trending_videos():
             color: inherit !important;
         }
         </style>
-    """, unsafe_allow_html=True)
+"""
+
+_VIDEO_CARD_TMPL = """<a href="{url}" target="_blank">
+    <div class="video-card">
+        <div class="thumbnail-container">
+            <img src="{thumbnail}" alt="{title}">
+        </div>
+        <div class="video-info">
+            <h3 class="video-title">{title}</h3>
+            <div class="meta-row">
+                <span class="meta-badge">👀 {views}</span>
+                <span class="meta-badge">💬 {comments}</span>
+            </div>
+        </div>
+    </div>
+</a>"""
+
+def video_card_html(video):
+    """비디오 카드 HTML 생성 (제목은 HTML 이스케이프)"""
+    return _VIDEO_CARD_TMPL.format(
+        url=video['url'],
+        thumbnail=video['thumbnail'],
+        title=escape(video['title']),
+        views=format_number(video['viewCount']),
+        comments=format_number(video['commentCount'])
+    )
+
+def render_video_columns(videos, num_columns=2):
+    """비디오 카드를 2열로 배치 (열마다 카드 HTML을 모아 한 번의 st.markdown으로 출력)"""
+    cols = st.columns(num_columns)
+    for idx, col in enumerate(cols):
+        with col:
+            st.markdown("".join(video_card_html(video) for video in videos[idx::num_columns]),
+                        unsafe_allow_html=True)
+
+def show_trending_videos():
+    # 두 API 호출은 서로 독립적이므로 동시에 실행
+    executor = get_api_executor()
+    trending_future = executor.submit(get_trending_videos)
+    woosoo_future = executor.submit(get_woosoo_videos)
+    trending_videos, woosoo_videos = trending_future.result(), woosoo_future.result()
+    
+    st.markdown(_TRENDING_CSS, unsafe_allow_html=True)
     
     # 웃소 최신 영상 섹션
     if woosoo_videos:
@@ -652,25 +964,7 @@ def show_trending_videos():
             </div>
         """, unsafe_allow_html=True)
         
-        cols = st.columns(2)
-        for idx, video in enumerate(woosoo_videos[:4]):
-            with cols[idx % 2]:
-                st.markdown(f"""
-                    <a href="{video['url']}" target="_blank">
-                        <div class="video-card">
-                            <div class="thumbnail-container">
-                                <img src="{video['thumbnail']}" alt="{video['title']}">
-                            </div>
-                            <div class="video-info">
-                                <h3 class="video-title">{video['title']}</h3>
-                                <div class="meta-row">
-                                    <span class="meta-badge">👀 {format_number(video['viewCount'])}</span>
-                                    <span class="meta-badge">💬 {format_number(video['commentCount'])}</span>
-                                </div>
-                            </div>
-                        </div>
-                    </a>
-                """, unsafe_allow_html=True)
+        render_video_columns(woosoo_videos[:4])
     
     # 인기 급상승 동영상 섹션
     if trending_videos:
@@ -680,29 +974,44 @@ def show_trending_videos():
             </div>
         """, unsafe_allow_html=True)
         
-        cols = st.columns(2)
-        for idx, video in enumerate(trending_videos[:4]):
-            with cols[idx % 2]:
-                st.markdown(f"""
-                    <a href="{video['url']}" target="_blank">
-                        <div class="video-card">
-                            <div class="thumbnail-container">
-                                <img src="{video['thumbnail']}" alt="{video['title']}">
-                            </div>
-                            <div class="video-info">
-                                <h3 class="video-title">{video['title']}</h3>
-                                <div class="meta-row">
-                                    <span class="meta-badge">👀 {format_number(video['viewCount'])}</span>
-                                    <span class="meta-badge">💬 {format_number(video['commentCount'])}</span>
-                                </div>
-                            </div>
-                        </div>
-                    </a>
-                """, unsafe_allow_html=True)
+        render_video_columns(trending_videos[:4])
+
+_VIDEO_PLAYER_TMPL = """<div class="video-player">
+    {embed}
+    <div class="video-info-box">
+        <h1 class="video-title">{title}</h1>
+        <span class="channel-name">{channel}</span>
+        <div class="meta-data">
+            <span class="meta-badge">👀 {views} 조회수</span>
+            <span class="meta-badge">💬 {comments} 댓글</span>
+            <span class="meta-badge">👍 {likes} 좋아요</span>
+        </div>
+    </div>
+</div>"""
+
+_AI_TITLES_TMPL = """<div style="
+    background: rgba(255, 75, 75, 0.1);
+    border-radius: 8px;
+    padding: 1rem;
+    margin-bottom: 1.5rem;
+">
+    <h3 style="
+        color: #FF4B4B;
+        margin-bottom: 0.5rem;
+        font-size: 1.2rem;
+    ">🤖 AI 추천 숏폼 제목</h3>
+    <div style="
+        color: white;
+        line-height: 1.6;
+        white-space: pre-line;
+    ">{titles}</div>
+</div>"""
 
 def process_video(url):
     try:
-        video_response = get_video_info(url)
+        # 비디오 ID는 한 번만 추출해서 정보 조회/임베드/댓글 조회에 재사용
+        video_id = _extract_video_id(url)
+        video_response = get_video_info(video_id)
         
         if video_response and video_response.get('items'):
             # 스타일 정의
@@ -760,6 +1069,8 @@ def process_video(url):
                 }
                 
                 .timestamp-badge {
+                    display: inline-block;
+                    text-decoration: none !important;
                     background: #FF4B4B;
                     color: white !important;
                     padding: 0.5rem 1rem;
@@ -861,125 +1172,72 @@ def process_video(url):
                 </style>
             """, unsafe_allow_html=True)
             
-            # JavaScript 함수를 components.html로 추가
-            st.components.v1.html("""
-                <script>
-                window.addEventListener('message', function(e) {
-                    if (e.data.type === 'jumpToTime') {
-                        const iframe = document.querySelector('iframe');
-                        if (iframe) {
-                            const newSrc = `https://www.youtube.com/embed/${e.data.videoId}?start=${e.data.time}&autoplay=1`;
-                            iframe.src = newSrc;
-                        }
-                    }
-                }, false);
-                </script>
-            """, height=0)
+            # 공유 가능한 주소가 되도록 비디오 ID를 쿼리 파라미터에 반영
+            if st.query_params.get("v") != video_id:
+                st.query_params["v"] = video_id
             
-            # 비디오 ID 추출
-            video_id = url.split('watch?v=')[1].split('&')[0]
+            # 댓글 분석과 AI 제목 생성은 영상당 한 번만 수행하고 세션에 보관
+            # (뒤로가기 등 재실행 시에는 API/캐시 조회 없이 바로 반환)
+            analysis = st.session_state.get('video_analysis')
+            if not analysis or analysis['video_id'] != video_id:
+                comments = get_comments(video_id)
+                sorted_moments = []
+                
+                if comments:
+                    for comment in comments:
+                        comment['timestamp'] = parse_timestamp(comment['text'])
+                    timeline_data = aggregate_timeline_comments(comments)
+                    # 좋아요 순 정렬은 한 번만 하고 AI 제목(상위 3개)/표시(상위 10개)에서 잘라 씀
+                    sorted_moments = sorted(timeline_data.items(), 
+                                            key=lambda x: x[1]['total_likes'], 
+                                            reverse=True)
+                
+                analysis = {
+                    'video_id': video_id,
+                    'sorted_moments': sorted_moments,
+                    'suggested_titles': generate_short_form_title(video_id, sorted_moments[:3]) if sorted_moments else None,
+                }
+                st.session_state.video_analysis = analysis
             
-            # 댓글 분석하여 최고 인기 타임스탬프 찾기
-            comments_df = get_comments(video_id)
-            start_time = 0
-            timeline_data = {}
-            current_time = st.session_state.get('current_time', 0)
+            sorted_moments = analysis['sorted_moments']
+            suggested_titles = analysis['suggested_titles']
             
-            if not comments_df.empty:
-                comments_df['timestamp'] = comments_df['text'].apply(parse_timestamp)
-                timeline_data = aggregate_timeline_comments(comments_df)
-                
-                if timeline_data:
-                    most_liked_moment = max(timeline_data.items(), 
-                                         key=lambda x: x[1]['total_likes'])
-                    start_time = most_liked_moment[0]
+            # 시작 시점: ?t=<초> 가 있으면 우선, 없으면 최고 인기 타임스탬프
+            requested_time = st.query_params.get("t", "")
+            if requested_time.isdigit():
+                start_time = int(requested_time)
+            elif sorted_moments:
+                start_time = int(sorted_moments[0][0])
+            else:
+                start_time = 0
             
             # 레이아웃 설정
             col1, col2 = st.columns([1, 1])
             
             with col1:
                 # 비디오 플레이어
-                st.markdown(f"""
-                    <div class="video-player">
-                        <iframe
-                            width="100%"
-                            height="500"
-                            src="https://www.youtube.com/embed/{video_id}?start={current_time or start_time}&autoplay=1"
-                            frameborder="0"
-                            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
-                            allowfullscreen
-                        ></iframe>
-                        <div class="video-info-box">
-                            <h1 class="video-title">{video_response['items'][0]['snippet']['title']}</h1>
-                            <span class="channel-name">{video_response['items'][0]['snippet']['channelTitle']}</span>
-                            <div class="meta-data">
-                                <span class="meta-badge">👀 {format_number(int(video_response['items'][0]['statistics']['viewCount']))} 조회수</span>
-                                <span class="meta-badge">💬 {format_number(int(video_response['items'][0]['statistics']['commentCount']))} 댓글</span>
-                                <span class="meta-badge">👍 {format_number(int(video_response['items'][0]['statistics'].get('likeCount', 0)))} 좋아요</span>
-                            </div>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
+                item = video_response['items'][0]
+                st.markdown(_VIDEO_PLAYER_TMPL.format(
+                    embed=create_youtube_embed(video_id, start_time),
+                    title=escape(item['snippet']['title']),
+                    channel=escape(item['snippet']['channelTitle']),
+                    views=format_number(int(item['statistics']['viewCount'])),
+                    comments=format_number(int(item['statistics']['commentCount'])),
+                    likes=format_number(int(item['statistics'].get('likeCount', 0)))
+                ), unsafe_allow_html=True)
             
             with col2:
                 st.markdown('<h2>🎯 인기 타임라인 모먼트</h2>', unsafe_allow_html=True)
                 
-                if timeline_data:
-                    # AI 제목 생성
-                    suggested_titles = generate_short_form_title(timeline_data)
+                if sorted_moments:
+                    # AI 추천 제목
                     if suggested_titles:
-                        st.markdown("""
-                            <div style="
-                                background: rgba(255, 75, 75, 0.1);
-                                border-radius: 8px;
-                                padding: 1rem;
-                                margin-bottom: 1.5rem;
-                            ">
-                                <h3 style="
-                                    color: #FF4B4B;
-                                    margin-bottom: 0.5rem;
-                                    font-size: 1.2rem;
-                                ">🤖 AI 추천 숏폼 제목</h3>
-                                <div style="
-                                    color: white;
-                                    line-height: 1.6;
-                                    white-space: pre-line;
-                                ">{}</div>
-                            </div>
-                        """.format(suggested_titles), unsafe_allow_html=True)
+                        # 제목은 댓글 문구를 그대로 쓰므로 HTML 이스케이프
+                        st.markdown(_AI_TITLES_TMPL.format(titles=escape(suggested_titles)),
+                                    unsafe_allow_html=True)
                     
                     # 타임라인 모먼트 표시
-                    for time, data in sorted(timeline_data.items(), 
-                                          key=lambda x: x[1]['total_likes'], 
-                                          reverse=True)[:10]:
-                        col_time, col_stats = st.columns([1, 2])
-                        
-                        with col_time:
-                            if st.button(f"🕒 {seconds_to_timestamp(time)}", 
-                                       key=f"time_{time}",
-                                       use_container_width=True):
-                                st.session_state.current_time = int(time)
-                                st.rerun()
-                        
-                        with col_stats:
-                            st.markdown(f"""
-                                <div class="stats">
-                                    <span>👍 {data['total_likes']}개</span>
-                                    <span>💬 {len(data['comments'])}개</span>
-                                </div>
-                            """, unsafe_allow_html=True)
-                            
-                        # 댓글 표시
-                        for comment in data['comments']:
-                            st.markdown(f"""
-                                <div class="comment-card">
-                                    <div class="comment-header">
-                                        <span class="comment-author">{comment['authorDisplayName']}</span>
-                                        <span class="comment-likes">👍 {comment['likeCount']}</span>
-                                    </div>
-                                    <div class="comment-text">{comment['text']}</div>
-                                </div>
-                            """, unsafe_allow_html=True)
+                    display_timeline_moments(video_id, sorted_moments[:10])
                 else:
                     st.info("타임스탬프가 포함된 댓글이 없습니다.")
                                 
@@ -989,115 +1247,3 @@ def process_video(url):
 
 if __name__ == "__main__":
     main()
-
-# 기존 스타일에 다음 CSS를 추가/수정
-
-st.markdown("""
-    <style>
-    /* 전체 텍스트 색상 오버라이드 */
-    .stMarkdown, .stMarkdown p, h1, h2, h3, h4, h5, h6, .stTextInput label, .stSelectbox label {
-        color: #FFFFFF !important;
-    }
-    
-    /* URL 입력 필드 레이블 */
-    .stTextInput > label {
-        color: #FFFFFF !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-    }
-    
-    /* 입력 필드 스타일링 */
-    .stTextInput > div > div {
-        background-color: rgba(255, 255, 255, 0.05) !important;
-        border-color: rgba(255, 255, 255, 0.1) !important;
-        color: #FFFFFF !important;
-    }
-    
-    .stTextInput > div > div:hover {
-        border-color: rgba(255, 75, 75, 0.5) !important;
-    }
-    
-    .stTextInput > div > div:focus-within {
-        border-color: #FF4B4B !important;
-    }
-    
-    /* 타임코드 하이퍼링크 박스 */
-    .timestamp-badge {
-        background: rgba(255, 75, 75, 0.1) !important;
-        color: #FF4B4B !important;
-        border: 1px solid rgba(255, 75, 75, 0.2) !important;
-    }
-    
-    .timestamp-badge:hover {
-        background: rgba(255, 75, 75, 0.2) !important;
-        border-color: rgba(255, 75, 75, 0.3) !important;
-    }
-    
-    /* 홈으로 버튼 */
-    .stButton > button[kind="secondary"] {
-        background-color: rgba(255, 255, 255, 0.1) !important;
-        color: #FFFFFF !important;
-        border: 1px solid rgba(255, 255, 255, 0.1) !important;
-    }
-    
-    .stButton > button[kind="secondary"]:hover {
-        background-color: rgba(255, 255, 255, 0.15) !important;
-        border-color: rgba(255, 255, 255, 0.2) !important;
-    }
-    
-    /* 섹션 헤더 (인기 타임라인 모먼트 등) */
-    .section-header h2 {
-        color: #FFFFFF !important;
-        font-size: 1.5rem !important;
-        font-weight: 600 !important;
-        margin-bottom: 1.5rem !important;
-    }
-    
-    /* 에러 메시지 */
-    .stAlert {
-        background-color: rgba(255, 75, 75, 0.1) !important;
-        color: #FF4B4B !important;
-    }
-    
-    /* 비디오 제목 */
-    .video-title {
-        color: #FFFFFF !important;
-        font-size: 1.5rem !important;
-        font-weight: 600 !important;
-        line-height: 1.4 !important;
-    }
-    
-    /* 채널명 */
-    .channel-name {
-        color: rgba(255, 255, 255, 0.7) !important;
-        font-size: 0.9rem !important;
-    }
-    
-    /* 로딩 스피너 */
-    .stSpinner > div {
-        border-color: #FF4B4B !important;
-    }
-    
-    /* 스크롤바 */
-    ::-webkit-scrollbar-track {
-        background: rgba(255, 255, 255, 0.05) !important;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: rgba(255, 255, 255, 0.1) !important;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: rgba(255, 255, 255, 0.2) !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-st.markdown("""
-    <style>
-    /* Deploy 바 숨기기 */
-    .stApp > header {
-        display: none !important;
-    }
-    </style>
-""", unsafe_allow_html=True)